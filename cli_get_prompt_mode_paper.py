@@ -1,7 +1,6 @@
 import os
 import sys
 import argparse
-import traceback
 from loguru import logger
 from core.smart_paper_core import SmartPaper
 from core.prompt_manager import list_prompts
@@ -40,8 +39,8 @@ def process_paper(
             f.write(result["result"])
 
     except Exception as e:
-        logger.error(f"处理失败: {str(e)}")
-        logger.error(f"错误详情: {traceback.format_exc()}")
+        # 错误栈交给loguru，仅在日志实际输出时才格式化
+        logger.opt(exception=True).error(f"处理失败: {str(e)}")
         sys.exit(1)
 
 
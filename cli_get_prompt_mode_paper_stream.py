@@ -29,8 +29,6 @@ def process_paper(url: str, prompt_name: str = "yuanbao"):
         output_dir = "outputs"
         os.makedirs(output_dir, exist_ok=True)
         output_file = os.path.join(output_dir, f"analysis_prompt_{prompt_name}.md")
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write("")
 
         # 初始化SmartPaper
         reader = SmartPaper(output_format="markdown")
@@ -38,13 +36,13 @@ def process_paper(url: str, prompt_name: str = "yuanbao"):
         # 流式处理论文并实时输出
         logger.info("分析结果:\n")
 
-        # 使用流式处理
-        for chunk in reader.process_paper_url_stream(url, prompt_name=prompt_name):
-            # 流式打印到控制台
-            print(chunk, end="", flush=True)
-            # 追加写入输出文件
-            with open(output_file, "a", encoding="utf-8") as f:
-                f.write(chunk)
+        # 使用流式处理，输出文件只打开一次，避免每个响应块都重新打开文件
+        with open(output_file, "wb", buffering=1 << 20) as f:
+            for chunk in reader.process_paper_url_stream(url, prompt_name=prompt_name):
+                # 流式打印到控制台
+                print(chunk, end="", flush=True)
+                # 写入输出文件
+                f.write(chunk.encode("utf-8"))
         print("\n")
 
         logger.info(f"分析结果已保存到: {output_file}")
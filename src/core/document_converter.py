@@ -86,7 +86,7 @@ class DocumentConverter:
 
             # 创建临时文件
             os.makedirs("temp", exist_ok=True)
-            temp_path = os.path.join("temp", f"{uuid.uuid4()}.pdf")
+            temp_path = os.path.join("temp", f"{uuid.uuid4().hex}.pdf")
 
             with open(temp_path, "wb") as temp_file:
                 for chunk in response.iter_content(chunk_size=8192):
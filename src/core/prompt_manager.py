@@ -21,6 +21,7 @@ class PromptLibrary:
             self.prompt_file = prompt_file
 
         self.prompts = self._load_prompts()
+        self._prompt_list: Optional[Dict[str, str]] = None  # list_prompts 的缓存结果
         logger.info(f"成功加载了 {len(self.prompts)} 个提示词模板")
 
     def _load_prompts(self) -> Dict:
@@ -55,11 +56,14 @@ class PromptLibrary:
         Returns:
             Dict[str, str]: 提示词名称和描述的字典
         """
-        return {name: info["description"] for name, info in self.prompts.items()}
+        if self._prompt_list is None:
+            self._prompt_list = {name: info["description"] for name, info in self.prompts.items()}
+        return self._prompt_list
 
     def reload(self):
         """重新加载提示词配置"""
         self.prompts = self._load_prompts()
+        self._prompt_list = None
 
 
 # 创建全局实例
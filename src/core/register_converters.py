@@ -23,10 +23,17 @@ try:
 except ImportError:
     _has_markitdown = False
 
+try:
+    from tools.everything_to_text.pdf_to_md_pymupdf import pymupdf_pdf2md
+
+    _has_pymupdf = True
+except ImportError:
+    _has_pymupdf = False
+
 
 def register_all_converters():
     """注册所有可用的转换器"""
-    # 注册 MarkItDown 转换器（作为默认PDF转换器）
+    # 注册 MarkItDown 转换器（PyMuPDF不可用时的后备转换器）
     if _has_markitdown:
         DocumentConverter.register("markitdown", markitdown_pdf2md)
 
@@ -34,6 +41,10 @@ def register_all_converters():
     if _has_mineru:
         DocumentConverter.register("mineru", mineru_pdf2md)
 
+    # 注册 PyMuPDF 转换器（默认PDF转换器，速度最快）
+    if _has_pymupdf:
+        DocumentConverter.register("pymupdf", pymupdf_pdf2md)
+
     # 在这里添加更多转换器的注册...
 
 
@@ -1,5 +1,7 @@
 import os
-from typing import Dict, List, Optional, Generator
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Generator, Tuple
 import yaml
 from pathlib import Path
 import requests
@@ -9,6 +11,44 @@ from core.document_converter import convert_to_text
 from utils.output_formatter import OutputFormatter
 from loguru import logger
 
+# arXiv论文转换结果缓存，键为 (url, converter_name)
+# 同一篇论文换提示词重新分析时无需再次下载和解析PDF
+_CONVERSION_CACHE_SIZE = 8
+_conversion_cache: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+_conversion_cache_lock = threading.Lock()
+
+
+def _get_cached_conversion(key: Tuple[str, str]) -> Optional[Dict]:
+    """读取缓存的转换结果
+
+    Args:
+        key (Tuple[str, str]): (url, converter_name)
+
+    Returns:
+        Optional[Dict]: 转换结果的副本，未命中时返回None
+    """
+    with _conversion_cache_lock:
+        result = _conversion_cache.get(key)
+        if result is None:
+            return None
+        _conversion_cache.move_to_end(key)
+    # 调用方会修改metadata，返回副本以免污染缓存
+    return {**result, "metadata": dict(result["metadata"])}
+
+
+def _set_cached_conversion(key: Tuple[str, str], result: Dict) -> None:
+    """写入转换结果缓存，超出容量时淘汰最久未使用的条目
+
+    Args:
+        key (Tuple[str, str]): (url, converter_name)
+        result (Dict): 转换结果
+    """
+    with _conversion_cache_lock:
+        _conversion_cache[key] = {**result, "metadata": dict(result["metadata"])}
+        _conversion_cache.move_to_end(key)
+        while len(_conversion_cache) > _CONVERSION_CACHE_SIZE:
+            _conversion_cache.popitem(last=False)
+
 
 class SmartPaper:
     """论文阅读和存档工具"""
@@ -68,7 +108,7 @@ class SmartPaper:
         try:
             # 转换PDF，使用配置中指定的转换器
             converter_name = self.config.get("document_converter", {}).get(
-                "converter_name", "markitdown"
+                "converter_name", "pymupdf"
             )
             result = convert_to_text(file_path, config=self.config, converter_name=converter_name)
             logger.info(f"转换PDF成功: {file_path}，使用转换器: {converter_name}")
@@ -124,54 +164,61 @@ class SmartPaper:
         try:
             # 获取配置中指定的转换器
             converter_name = self.config.get("document_converter", {}).get(
-                "converter_name", "markitdown"
+                "converter_name", "pymupdf"
             )
 
             # 判断是否为PDF文件
             is_arxiv = "arxiv.org" in url.lower()
 
             if is_arxiv:
-                # 创建temp目录用于处理当前请求
-                temp_dir = os.path.join(
-                    os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "temp"
-                )
-                os.makedirs(temp_dir, exist_ok=True)
-
-                # 从URL提取文件名
-                arxiv_id = url.split("/")[-1]
-                if not arxiv_id.endswith(".pdf"):
-                    arxiv_id += ".pdf"
-                temp_path = os.path.join(temp_dir, arxiv_id)
-
-                # 下载PDF文件
-                logger.info(f"开始下载PDF: {url}")
-                try:
-                    response = requests.get(url, timeout=30)  # 设置超时
-                    response.raise_for_status()
-
-                    # 保存到临时目录
-                    with open(temp_path, "wb") as f:
-                        f.write(response.content)
-                    logger.info("PDF下载完成")
-                except Exception as e:
-                    raise Exception(f"下载PDF失败: {str(e)}")
-
-                # 转换PDF文件
-                result = convert_to_text(
-                    temp_path, config=self.config, converter_name=converter_name
-                )
-                logger.info(f"PDF转换完成，使用转换器: {converter_name}")
-
-                # 处理文本内容
-                text_content = result["text_content"]
-                if "References" in text_content:
-                    text_content = text_content.split("References")[0]
-                text_content = "\n".join(
-                    [line for line in text_content.split("\n") if line.strip()]
-                )
+                cache_key = (url, converter_name)
+                result = _get_cached_conversion(cache_key)
+                if result is not None:
+                    logger.info(f"使用缓存的PDF转换结果: {url}")
+                else:
+                    # 创建temp目录用于处理当前请求
+                    temp_dir = os.path.join(
+                        os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "temp"
+                    )
+                    os.makedirs(temp_dir, exist_ok=True)
+
+                    # 从URL提取文件名
+                    arxiv_id = url.rpartition("/")[2]
+                    if not arxiv_id.endswith(".pdf"):
+                        arxiv_id += ".pdf"
+                    temp_path = os.path.join(temp_dir, arxiv_id)
+
+                    # 下载PDF文件
+                    logger.info(f"开始下载PDF: {url}")
+                    try:
+                        response = requests.get(url, timeout=30)  # 设置超时
+                        response.raise_for_status()
+
+                        # 保存到临时目录
+                        with open(temp_path, "wb") as f:
+                            f.write(response.content)
+                        logger.info("PDF下载完成")
+                    except Exception as e:
+                        raise Exception(f"下载PDF失败: {str(e)}")
+
+                    # 转换PDF文件
+                    result = convert_to_text(
+                        temp_path, config=self.config, converter_name=converter_name
+                    )
+                    logger.info(f"PDF转换完成，使用转换器: {converter_name}")
+
+                    # 处理文本内容
+                    text_content = result["text_content"]
+                    if "References" in text_content:
+                        text_content = text_content.split("References")[0]
+                    text_content = "\n".join(
+                        [line for line in text_content.split("\n") if line.strip()]
+                    )
+
+                    # 更新结果
+                    result["text_content"] = text_content
+                    _set_cached_conversion(cache_key, result)
 
-                # 更新结果
-                result["text_content"] = text_content
                 result["metadata"]["url"] = url
                 if description:
                     result["metadata"]["description"] = description
@@ -203,7 +250,7 @@ class SmartPaper:
                 logger.info(f"HTML转换完成，使用转换器: {converter_name}")
 
                 # 添加元数据
-                metadata = {"title": url.split("/")[-1], "url": url, "file_type": "html"}
+                metadata = {"title": url.rpartition("/")[2], "url": url, "file_type": "html"}
                 result["metadata"] = {**result.get("metadata", {}), **metadata}
 
                 return result
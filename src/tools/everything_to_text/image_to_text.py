@@ -16,6 +16,7 @@
 - 将提取的内容保存为Markdown文件
 - 支持多种图像处理细节级别
 - 支持自定义提示和模型选择
+- 上传前自动等比缩小超大图像，减少上传字节数和视觉token消耗
 
 #### 注意事项：
 - 请确保正确配置API密钥
@@ -26,12 +27,68 @@
 from openai import OpenAI
 from dotenv import load_dotenv
 import os
+import io
 import base64
+from functools import lru_cache
 from typing import Any, Dict
 from pathlib import Path
 from PIL import Image
 from loguru import logger
 
+# 视觉模型API可直接接收的图像格式（PIL格式名 -> MIME类型），其他格式上传前转为PNG
+_MIME_BY_FORMAT = {
+    "JPEG": "image/jpeg",
+    "MPO": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+    "GIF": "image/gif",
+}
+
+# Base64编码后的图像文件头 -> MIME类型
+_MIME_BY_BASE64_PREFIX = (
+    ("iVBORw0KGgo", "image/png"),
+    ("/9j/", "image/jpeg"),
+    ("R0lGOD", "image/gif"),
+    ("UklGR", "image/webp"),
+)
+
+
+def _flatten_to_rgb(img: Image.Image) -> Image.Image:
+    """
+    将图像转换为RGB模式，带透明通道的图像先合成到白色背景上。
+
+    透明区域下的像素通常为黑色，直接丢弃透明通道会得到一张近乎全黑的图。
+
+    Args:
+        img (Image.Image): 原始图像
+
+    Returns:
+        Image.Image: RGB模式的图像
+    """
+    if img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info):
+        rgba_img = img.convert("RGBA")
+        background = Image.new("RGB", rgba_img.size, (255, 255, 255))
+        background.paste(rgba_img, mask=rgba_img.getchannel("A"))
+        return background
+    return img.convert("RGB")
+
+
+def _detect_mime(b64: str) -> str:
+    """
+    根据Base64字符串开头的文件头判断图像的MIME类型。
+
+    Args:
+        b64 (str): 不带data URL前缀的Base64字符串
+
+    Returns:
+        str: MIME类型，无法识别时返回image/png
+    """
+    head = b64[:12]
+    for prefix, mime_type in _MIME_BY_BASE64_PREFIX:
+        if head.startswith(prefix):
+            return mime_type
+    return "image/png"
+
 
 class ImageTextExtractor:
     """图像文本提取器类，用于将图像内容转换为文本或Markdown格式。"""
@@ -122,6 +179,7 @@ class ImageTextExtractor:
         prompt: str = None,
         temperature: float = 0.1,
         top_p: float = 0.5,
+        max_image_size: int = 0,
     ) -> str:
         """
         提取图像中的文本并转换为Markdown格式。
@@ -134,6 +192,7 @@ class ImageTextExtractor:
             prompt (str): 提示文本
             temperature (float): 生成文本的温度参数
             top_p (float): 生成文本的top_p参数
+            max_image_size (int): 本地图像长边的像素上限，超出时先缩小再上传，默认为0即不缩小
 
         Returns:
             str: 提取的Markdown格式文本
@@ -148,13 +207,14 @@ class ImageTextExtractor:
         ):
             raise ValueError("Image URL must be a valid HTTP/HTTPS URL or a Base64 encoded string")
 
+        # 裸Base64字符串补上data URL前缀，MIME类型按文件头判断
+        if image_url and not image_url.startswith(("http://", "https://", "data:")):
+            image_url = f"data:{_detect_mime(image_url)};base64,{image_url}"
+
         if local_image_path:
             if not os.path.exists(local_image_path):
                 raise FileNotFoundError(f"The file {local_image_path} does not exist.")
-            image_extension: str = self._get_image_extension(local_image_path)
-            with open(local_image_path, "rb") as image_file:
-                base64_image: str = base64.b64encode(image_file.read()).decode("utf-8")
-                image_url = f"data:image/{image_extension};base64,{base64_image}"
+            image_url = self._load_image_as_data_url(local_image_path, max_image_size)
 
         if detail not in ["low", "high", "auto"]:
             raise ValueError("Invalid detail value. Allowed values are 'low', 'high', 'auto'")
@@ -184,11 +244,12 @@ class ImageTextExtractor:
                 top_p=top_p,
             )
 
-            result: str = ""
+            result_parts: list[str] = []
             for chunk in response:
                 chunk_message: str = chunk.choices[0].delta.content
-                result += chunk_message
-            return result
+                if chunk_message:
+                    result_parts.append(chunk_message)
+            return "".join(result_parts)
         except Exception as e:
             raise RuntimeError(f"Failed to extract text from image: {e}")
 
@@ -211,22 +272,63 @@ class ImageTextExtractor:
         except Exception:
             return False
 
-    def _get_image_extension(self, file_path: str) -> str:
+    def _load_image_as_data_url(self, image_path: str, max_image_size: int) -> str:
         """
-        获取图像文件的扩展名。
+        读取本地图像并编码为data URL，长边超过上限时先等比缩小为JPEG，
+        视觉模型不支持的格式（如TIFF、BMP）转为PNG。
 
         Args:
-            file_path (str): 图像文件路径
+            image_path (str): 图像文件路径
+            max_image_size (int): 图像长边的像素上限，为0时不缩小
 
         Returns:
-            str: 图像文件的扩展名
+            str: data URL格式的图像
         """
+        image_bytes = None
         try:
-            with Image.open(file_path) as img:
-                return img.format.lower()
+            with Image.open(image_path) as img:
+                mime_type = _MIME_BY_FORMAT.get(img.format)
+                if max_image_size and max(img.size) > max_image_size:
+                    rgb_img = _flatten_to_rgb(img)
+                    rgb_img.thumbnail((max_image_size, max_image_size), Image.LANCZOS)
+                    buffer = io.BytesIO()
+                    rgb_img.save(buffer, "JPEG", quality=85)
+                    image_bytes = buffer.getvalue()
+                    mime_type = "image/jpeg"
+                elif mime_type is None:
+                    if img.mode not in ("1", "L", "LA", "P", "RGB", "RGBA"):
+                        img = img.convert("RGB")
+                    buffer = io.BytesIO()
+                    img.save(buffer, "PNG")
+                    image_bytes = buffer.getvalue()
+                    mime_type = "image/png"
         except Exception as e:
             raise ValueError(f"Failed to determine image format: {e}")
 
+        if image_bytes is None:
+            with open(image_path, "rb") as image_file:
+                image_bytes = image_file.read()
+        base64_image: str = base64.b64encode(image_bytes).decode("utf-8")
+        return f"data:{mime_type};base64,{base64_image}"
+
+
+@lru_cache(maxsize=8)
+def _get_extractor(
+    api_key: str = None, prompt: str = None, prompt_path: str = None
+) -> ImageTextExtractor:
+    """
+    获取可复用的ImageTextExtractor实例，避免每张图片都重新创建OpenAI客户端和连接池。
+
+    Args:
+        api_key (str): API密钥
+        prompt (str): 提示文本
+        prompt_path (str): 提示文本文件路径
+
+    Returns:
+        ImageTextExtractor: 图像文本提取器实例
+    """
+    return ImageTextExtractor(api_key=api_key, prompt=prompt, prompt_path=prompt_path)
+
 
 def image_to_base64(image_path: str) -> str:
     """
@@ -288,13 +390,12 @@ def describe_image(
     Returns:
         str: 图像内容描述
     """
-    extractor = ImageTextExtractor(
-        api_key=api_key, prompt=prompt, prompt_path=description_prompt_path
-    )
+    extractor = _get_extractor(api_key, prompt, description_prompt_path)
 
     try:
+        # 描述图像内容无需原始分辨率，大图先缩小再上传；OCR保持原图以免损失小字和公式
         result = extractor.extract_image_text(
-            local_image_path=image_path, model=model, detail="low"
+            local_image_path=image_path, model=model, detail="low", max_image_size=1280
         )
         if not result.strip():
             return None
@@ -323,7 +424,7 @@ def extract_text_from_image(
     Returns:
         str: 提取的文本内容
     """
-    extractor = ImageTextExtractor(api_key=api_key, prompt=prompt, prompt_path=ocr_prompt_path)
+    extractor = _get_extractor(api_key, prompt, ocr_prompt_path)
 
     try:
         result = extractor.extract_image_text(
@@ -351,4 +452,4 @@ def save_result_to_file(content: str, path: str = "results/result.md"):
 
     with open(output_path, "w", encoding="utf-8") as f:
         f.write(content)
-    logger.info(f"结果已保存到文件: {output_path}")
+    logger.info("结果已保存到文件: {}", output_path)
@@ -0,0 +1,163 @@
+"""
+#### 使用说明：
+
+该代码提供了基于PyMuPDF的PDF转文本转换功能的封装。
+
+#### 主要功能：
+- 使用MuPDF的C实现逐页提取PDF文本，速度远快于基于pdfminer的解析器
+- 可选地将PDF内嵌图片按原始格式导出到指定目录
+
+#### 参数说明：
+
+- **pymupdf_pdf2md函数**：
+  - `file_path (str)`: 要转换的PDF文件路径。
+  - `llm_client (Any, optional)`: LLM客户端，保留以兼容转换器接口。
+  - `llm_model (str, optional)`: LLM模型名称，保留以兼容转换器接口。
+  - `config (Dict, optional)`: 配置信息。
+  - `ocr_enabled (bool, optional)`: 是否启用OCR功能，保留以兼容转换器接口。
+  - `image_dir (str, optional)`: 图片导出目录，默认为None时不导出图片。
+  - **返回值**：返回一个包含`text_content`（提取的文本），`metadata`（PDF元数据），以及`images`（导出的图片信息）的字典。
+
+#### 注意事项：
+- 请确保安装了`pymupdf`依赖库。
+- 只支持PDF文件格式。
+"""
+
+import os
+from typing import Any, Dict, List
+from pathlib import Path
+
+import pymupdf
+
+# 浏览器和视觉模型都能直接使用的图片格式的文件头
+_JPEG_MAGIC = b"\xff\xd8\xff"
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+
+def extract_text(doc: pymupdf.Document) -> str:
+    """逐页提取PDF文本
+
+    Args:
+        doc (pymupdf.Document): 已打开的PDF文档
+
+    Returns:
+        str: 以空行分隔的各页文本
+    """
+    return "\n\n".join(page.get_text("text") for page in doc)
+
+
+def _sniff_image_ext(data: bytes) -> str:
+    """根据文件头判断图片是否为JPEG或PNG
+
+    Args:
+        data (bytes): 图片字节
+
+    Returns:
+        str: "jpeg"、"png"，无法识别时返回空字符串
+    """
+    if data[:3] == _JPEG_MAGIC:
+        return "jpeg"
+    if data[:8] == _PNG_MAGIC:
+        return "png"
+    return ""
+
+
+def _to_png_bytes(doc: pymupdf.Document, xref: int) -> bytes:
+    """将PDF中的图片对象重新编码为PNG
+
+    Args:
+        doc (pymupdf.Document): 已打开的PDF文档
+        xref (int): 图片对象编号
+
+    Returns:
+        bytes: PNG图片字节
+    """
+    pix = pymupdf.Pixmap(doc, xref)
+    # PNG不支持CMYK等色彩空间，先转换为RGB
+    if pix.n - pix.alpha >= 4:
+        pix = pymupdf.Pixmap(pymupdf.csRGB, pix)
+    return pix.tobytes("png")
+
+
+def extract_images(doc: pymupdf.Document, output_dir: str) -> List[Dict]:
+    """导出PDF中的内嵌图片
+
+    JPEG和PNG图片字节直接取自PDF中的图片流，不经过解码再编码；
+    JPX、JBIG2等其他格式统一转换为PNG。
+    多个页面引用同一图片对象（如页眉logo）时只导出一次。
+
+    Args:
+        doc (pymupdf.Document): 已打开的PDF文档
+        output_dir (str): 图片保存目录
+
+    Returns:
+        List[Dict]: 图片信息列表，每项包含 path、page、ext
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    images = []
+    seen_xrefs = set()
+    for page_num, page in enumerate(doc, start=1):
+        for img_index, img in enumerate(page.get_images(), start=1):
+            xref = img[0]
+            if xref in seen_xrefs:
+                continue
+            seen_xrefs.add(xref)
+            image_info = doc.extract_image(xref)
+            if not image_info:
+                continue
+            data = image_info["image"]
+            ext = _sniff_image_ext(data)
+            if not ext:
+                data = _to_png_bytes(doc, xref)
+                ext = "png"
+            image_path = os.path.join(output_dir, f"page{page_num}_img{img_index}.{ext}")
+            with open(image_path, "wb") as f:
+                f.write(data)
+            images.append({"path": image_path, "page": page_num, "ext": ext})
+    return images
+
+
+def pymupdf_pdf2md(
+    file_path: str,
+    llm_client: Any = None,
+    llm_model: str = None,
+    config: Dict = None,
+    ocr_enabled: bool = False,
+    image_dir: str = None,
+) -> Dict:
+    """使用PyMuPDF将PDF文件转换为文本
+
+    Args:
+        file_path (str): PDF文件路径
+        llm_client (Any, optional): LLM客户端，保留以兼容转换器接口
+        llm_model (str, optional): LLM模型名称，保留以兼容转换器接口
+        config (Dict, optional): 配置信息
+        ocr_enabled (bool, optional): 是否启用OCR功能，保留以兼容转换器接口
+        image_dir (str, optional): 图片导出目录，默认为None时不导出图片
+
+    Returns:
+        Dict: 包含转换结果的字典
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(f"文件不存在: {file_path}")
+
+    ext = file_path.suffix.lower()
+    if ext != ".pdf":
+        raise ValueError(f"只支持PDF文件，当前文件类型: {ext}")
+
+    try:
+        with pymupdf.open(str(file_path)) as doc:
+            text_content = extract_text(doc)
+            images = extract_images(doc, image_dir) if image_dir else []
+            pdf_metadata = doc.metadata or {}
+            metadata = {
+                "title": pdf_metadata.get("title", ""),
+                "author": pdf_metadata.get("author", ""),
+                "creation_date": pdf_metadata.get("creationDate", ""),
+                "modification_date": pdf_metadata.get("modDate", ""),
+                "page_count": doc.page_count,
+            }
+        return {"text_content": text_content, "metadata": metadata, "images": images}
+    except Exception as e:
+        raise Exception(f"PDF转换失败: {str(e)}")
@@ -18,17 +18,20 @@
   - 返回:
     - list: 包含所有找到的Markdown文件路径的列表。
 
-- `process_markdown_image(file_path, force_add_desc=False)`
+- `process_markdown_image(file_path, force_add_desc=False, image_concurrency=8, executor=None)`
   - 参数:
     - `file_path`: str, Markdown文件的路径。
     - `force_add_desc`: bool, 是否强制为所有图片添加描述。
+    - `image_concurrency`: int, 同时请求图片描述的最大并发数。
+    - `executor`: ThreadPoolExecutor, 可选，复用外部线程池；未提供时按 `image_concurrency` 临时创建。
   - 副作用:
     - 修改原始Markdown文件。
     - 在控制台输出处理状态。
 
-- `add_md_image_description(path, force_add_desc=True)`
+- `add_md_image_description(path, force_add_desc=True, image_concurrency=8)`
   - 参数:
     - `path`: str, 要处理的目录路径。
+    - `image_concurrency`: int, 同时请求图片描述的最大并发数。
   - 副作用:
     - 处理目录下所有Markdown文件中的图片描述。
 
@@ -36,15 +39,23 @@
 
 - 路径必须是绝对路径。
 - 依赖 `describe_image` 函数，需要确保该函数可用。
+- 图片描述请求会并发发送，`image_concurrency` 过大可能触发视觉模型API的限流。
 
 """
 
 import os  # 用于文件和目录操作
 import re  # 用于正则表达式处理
+from concurrent.futures import ThreadPoolExecutor  # 用于并发请求图片描述
 from pathlib import Path  # 用于跨平台的路径操作
 from tools.everything_to_text.image_to_text import describe_image
 from loguru import logger
 
+# Markdown图片标记：![描述](路径)
+_IMG_RE = re.compile(r"!\[(.*?)\]\((.*?)\)")
+
+# 图片描述中需要去除的特殊字符，避免破坏Markdown图片语法
+_DESC_STRIP_TABLE = str.maketrans("", "", "[]|\n<>{}()\\#*`")
+
 
 def read_markdown_files(path):
     """
@@ -66,13 +77,17 @@ def read_markdown_files(path):
     return [str(p) for p in path.rglob("*") if p.suffix.lower() in (".md", ".markdown")]
 
 
-def process_markdown_image(file_path, force_add_desc=False, prompt=None):
+def process_markdown_image(
+    file_path, force_add_desc=False, prompt=None, image_concurrency=8, executor=None
+):
     """
     处理单个Markdown文件，为无描述的图片添加AI生成的描述
 
     参数:
         file_path: str, Markdown文件的路径
         force_add_desc: bool, 是否强制为所有图片添加描述
+        image_concurrency: int, 同时请求图片描述的最大并发数
+        executor: ThreadPoolExecutor, 可选，复用外部线程池；未提供时按image_concurrency临时创建
 
     副作用:
         - 修改原始Markdown文件
@@ -119,60 +134,82 @@ def process_markdown_image(file_path, force_add_desc=False, prompt=None):
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
 
+        # 不含图片标记的文件无需进行正则扫描
+        if "![" not in content:
+            logger.info("无需修改: {}", file_path)
+            return
+
         # 获取Markdown文件所在目录路径
         markdown_dir = os.path.dirname(file_path)
-        modified = False  # 标记文件是否被修改
-
-        def desc_replacer(match):
-            """
-            闭包函数：处理每个匹配到的图片标记
-
-            参数:
-                match: re.Match对象，包含匹配到的图片标记信息
 
-            返回:
-                str: 处理后的图片标记字符串
-            """
-            nonlocal modified
+        # 先收集需要添加描述的图片（按路径去重），再以有限并发批量请求描述，
+        # 避免逐张串行等待，同时防止一次性发出过多请求触发限流
+        image_paths = {}  # Markdown中的图片路径 -> 图片完整路径
+        descriptions = {}  # 图片完整路径 -> 生成的描述
+        matches = list(_IMG_RE.finditer(content))  # 替换阶段复用，无需再次扫描全文
+        for match in matches:
             desc, img_path = match.groups()
             # 当强制添加描述或原描述为空时处理
-            if force_add_desc or not desc.strip():
+            if (force_add_desc or not desc.strip()) and img_path not in image_paths:
                 # 构建图片的完整路径
                 full_path = os.path.normpath(os.path.join(markdown_dir, img_path))
                 if os.path.exists(full_path):
-
-                    # 使用正则表达式去除描述中的特殊字符
-                    new_desc = re.sub(
-                        r"[\[\]\|\n\<\>\{\}\(\)\\\#\*`]",
-                        "",
-                        describe_image(full_path, prompt=prompt),
-                    )
-                    modified = True
-                    return f"![{new_desc}]({img_path})"
-            return match.group(0)
-
-        # 使用正则表达式匹配并替换图片标记
-        pattern = re.compile(r"!\[(.*?)\]\((.*?)\)")
-        new_content = pattern.sub(desc_replacer, content)
+                    image_paths[img_path] = full_path
+                    descriptions[full_path] = None
+
+        if descriptions:
+            own_executor = executor is None
+            if own_executor:
+                executor = ThreadPoolExecutor(max_workers=image_concurrency)
+            try:
+                results = executor.map(
+                    lambda full_path: describe_image(full_path, prompt=prompt), descriptions
+                )
+                for full_path, description in zip(list(descriptions), results):
+                    # 去除描述中的特殊字符
+                    descriptions[full_path] = description.translate(_DESC_STRIP_TABLE)
+            finally:
+                if own_executor:
+                    executor.shutdown()
+
+        # 替换时按Markdown中的原始路径直接查表，无需再拼接和规范化路径
+        new_descs = {
+            img_path: descriptions[full_path] for img_path, full_path in image_paths.items()
+        }
+
+        # 按收集阶段的匹配结果拼接新内容：未改动的文本直接切片，最后只做一次join
+        parts = []
+        pos = 0
+        for match in matches:
+            desc, img_path = match.groups()
+            new_desc = new_descs.get(img_path)
+            if new_desc is not None and (force_add_desc or not desc.strip()):
+                parts.append(content[pos : match.start()])
+                parts.append(f"![{new_desc}]({img_path})")
+                pos = match.end()
+        modified = bool(parts)  # 标记文件是否被修改
 
         # 如果文件被修改，写入新内容
         if modified:
+            parts.append(content[pos:])
             with open(file_path, "w", encoding="utf-8") as f:
-                f.write(new_content)
-            logger.info(f"已更新文件: {file_path}")
+                f.write("".join(parts))
+            logger.info("已更新文件: {}", file_path)
         else:
-            logger.info(f"无需修改: {file_path}")
+            logger.info("无需修改: {}", file_path)
 
     except Exception as e:
-        logger.error(f"处理文件 {file_path} 时出错: {str(e)}")
+        logger.error("处理文件 {} 时出错: {}", file_path, e)
 
 
-def add_md_image_description(path, force_add_desc=True):
+def add_md_image_description(path, force_add_desc=True, image_concurrency=8):
     """
     主处理流程
 
     参数:
         path: str, 要处理的目录路径
+        force_add_desc: bool, 是否强制为所有图片添加描述
+        image_concurrency: int, 同时请求图片描述的最大并发数
 
     副作用:
         处理目录下所有Markdown文件中的图片描述
@@ -181,6 +218,10 @@ def add_md_image_description(path, force_add_desc=True):
     if not path.is_absolute():
         raise ValueError("路径必须是绝对路径")
 
-    for md_file in read_markdown_files(path):
-        logger.info(f"正在处理: {md_file}")
-        process_markdown_image(md_file, force_add_desc=force_add_desc)
+    # 所有文件共用一个线程池，避免每个文件重复创建和销毁线程
+    with ThreadPoolExecutor(
+        max_workers=image_concurrency, thread_name_prefix="smartpaper-image"
+    ) as executor:
+        for md_file in read_markdown_files(path):
+            logger.info("正在处理: {}", md_file)
+            process_markdown_image(md_file, force_add_desc=force_add_desc, executor=executor)
@@ -12,33 +12,211 @@ import os
 import streamlit as st
 from loguru import logger
 import yaml
-import re
 from core.smart_paper_core import SmartPaper
 from core.prompt_manager import list_prompts
-from typing import List, Dict
+from typing import List, Dict, NamedTuple
 import sys
+import time
+from functools import lru_cache
 import uuid  # 用于生成用户唯一ID
-import traceback  # 用于打印完整的错误栈
 
+# 优先使用RE2（线性时间匹配，无回溯），未安装时回退到标准库re
+try:
+    import re2 as _re_engine
+except ImportError:
+    import re as _re_engine
+
+# 分析结果输出目录，在脚本入口处创建
+_OUTPUT_DIR = "outputs"
+
+# 流式输出时的刷新节流：新增字符数达到阈值或距上次刷新超过间隔（秒）才重新渲染
+RENDER_BATCH_CHARS = 2048
+RENDER_INTERVAL = 0.1
+
+# arXiv论文URL格式，分组依次为 abs/pdf、论文编号、版本号
+# 使用fullmatch整体匹配并限定编号位数（RE2不支持\Z锚点）；允许结尾带 .pdf 或 /
+_ARXIV_RE = _re_engine.compile(
+    r"https?://arxiv\.org/(abs|pdf)/([0-9]{4,5}\.[0-9]{4,6})(v[0-9]+)?(?:\.pdf)?/?"
+)
+
+# 侧边栏中可选的示例论文URL
+EXAMPLE_URLS = (
+    "https://arxiv.org/pdf/2305.12002",
+    "https://arxiv.org/abs/2310.06825",
+    "https://arxiv.org/pdf/2303.08774",
+    "https://arxiv.org/abs/2307.09288",
+    "https://arxiv.org/pdf/2312.11805",
+)
+
+# 页面自定义CSS样式
+CUSTOM_CSS = """
+<style>
+    /* 整体页面样式 */
+    .main {
+        background-color: #f8f9fa;
+        padding: 20px;
+    }
+
+    /* 标题样式 */
+    h1 {
+        color: #1e3a8a;
+        font-weight: 700;
+        margin-bottom: 30px;
+        text-align: center;
+        padding-bottom: 10px;
+        border-bottom: 2px solid #3b82f6;
+    }
+
+    /* 副标题样式 */
+    h3 {
+        color: #1e40af;
+        font-weight: 600;
+        margin-top: 20px;
+        margin-bottom: 15px;
+        padding-left: 10px;
+        border-left: 4px solid #3b82f6;
+    }
+
+    /* 聊天消息容器 */
+    .stChatMessage {
+        border-radius: 10px;
+        margin-bottom: 15px;
+        box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+    }
+
+    /* 按钮样式 */
+    .stButton>button {
+        border-radius: 8px;
+        font-weight: 500;
+        transition: all 0.3s ease;
+    }
+
+    .stButton>button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+    }
+
+    /* 下载按钮样式 */
+    .stDownloadButton>button {
+        background-color: #4f46e5;
+        color: white;
+        border: none;
+        padding: 5px 15px;
+        border-radius: 6px;
+    }
+
+    /* 侧边栏样式 */
+    .css-1d391kg {
+        background-color: #f1f5f9;
+        padding: 20px 10px;
+    }
+
+    /* 输入框样式 */
+    .stTextInput>div>div>input {
+        border-radius: 8px;
+        border: 1px solid #d1d5db;
+        padding: 10px;
+    }
+
+    /* URL输入框高亮样式 */
+    .url-input {
+        border: 2px solid #3b82f6 !important;
+        background-color: #eff6ff !important;
+        box-shadow: 0 0 10px rgba(59, 130, 246, 0.3) !important;
+    }
+
+    /* 选择框样式 */
+    .stSelectbox>div>div {
+        border-radius: 8px;
+    }
+</style>
+"""
+
+# 页面标题下方的项目说明
+HEADER_HTML = """
+<div style="color: gray; font-size: 0.8em;">
+    <b>SmartPaper</b>: <a href="https://github.com/sanbuphy/SmartPaper">GitHub</a> -
+    一个迷你助手，帮助您快速阅读论文
+</div>
+"""
+
+# URL输入框上方的提示
+URL_INPUT_HINT_HTML = """
+<div style="margin-top: 20px; margin-bottom: 10px; font-weight: bold; color: #1e40af;">
+    👇 请在下方输入论文URL 👇
+</div>
+"""
+
+# 高亮URL输入框的脚本
+URL_HIGHLIGHT_SCRIPT = """
+<script>
+    // 等待页面加载完成
+    setTimeout(function() {
+        // 获取URL输入框并添加高亮样式
+        const urlInput = document.querySelector('[data-testid="stTextInput"] input');
+        if (urlInput) {
+            urlInput.classList.add('url-input');
+        }
+    }, 500);
+</script>
+"""
+
+# 侧边栏的使用说明
+USAGE_INSTRUCTIONS_HTML = """
+<div style="margin-top: 30px; padding: 15px; background-color: #e0f2fe; border-radius: 8px; border-left: 4px solid #0ea5e9;">
+    <h4 style="margin-top: 0; color: #0369a1;">使用说明</h4>
+    <p style="font-size: 0.9em; color: #0c4a6e;">
+        1. 输入arXiv论文URL<br>
+        2. 选择合适的提示词模板<br>
+        3. 点击"开始分析"按钮<br>
+        4. 等待分析完成后可下载结果
+    </p>
+</div>
+"""
+
+
+class ArxivUrl(NamedTuple):
+    """校验后的arXiv URL及其解析结果"""
+
+    url: str  # 格式化后的PDF链接
+    arxiv_id: str  # 论文编号，如 2305.12002
+    version: str  # 版本号，如 v2，未指定时为空字符串
+    pdf_name: str  # 论文编号加版本号，用于输出文件名
+
+
+class Chunk(NamedTuple):
+    """process_paper产生的一个响应块"""
+
+    content: str
+
+
+class Final(NamedTuple):
+    """process_paper的最终结果"""
 
-def validate_and_format_arxiv_url(url: str) -> str:
+    success: bool
+    file_path: str = ""  # 成功时结果文件的路径
+    error: str = ""  # 失败时的错误信息
+
+
+@lru_cache(maxsize=256)
+def validate_and_format_arxiv_url(url: str) -> ArxivUrl:
     """验证并格式化arXiv URL
 
-    将abs格式转换为pdf格式，并验证URL格式
+    将abs格式转换为pdf格式，并验证URL格式。
+    返回值是不可变的ArxivUrl，按输入URL缓存，同一URL重复校验时直接返回缓存结果。
 
     Args:
         url: 输入的arXiv URL
 
     Returns:
-        格式化后的URL
+        格式化后的URL及解析出的论文编号、版本号
 
     Raises:
         ValueError: 如果URL格式不正确
     """
     logger.debug(f"验证URL格式: {url}")
     # 检查是否是arXiv URL
-    arxiv_pattern = r"https?://arxiv\.org/(abs|pdf)/(\d+\.\d+)(v\d+)?"
-    match = re.match(arxiv_pattern, url)
+    match = _ARXIV_RE.fullmatch(url.strip())
 
     if not match:
         logger.warning(f"URL格式不正确: {url}")
@@ -47,38 +225,84 @@ def validate_and_format_arxiv_url(url: str) -> str:
     # 提取arXiv ID
     arxiv_id = match.group(2)
     version = match.group(3) or ""
+    pdf_name = f"{arxiv_id}{version}"
 
     # 确保使用PDF格式
-    formatted_url = f"https://arxiv.org/pdf/{arxiv_id}{version}"
+    formatted_url = f"https://arxiv.org/pdf/{pdf_name}"
 
     if match.group(1) == "abs":
         logger.info(f"URL格式已从abs转换为pdf: {url} -> {formatted_url}")
     else:
         logger.debug(f"URL格式已验证: {formatted_url}")
 
-    return formatted_url
+    return ArxivUrl(formatted_url, arxiv_id, version, pdf_name)
+
+
+class StreamRenderer:
+    """流式输出的节流渲染器
+
+    收集响应块，新增字符数达到阈值或距上次刷新超过间隔时才重新渲染占位区域，
+    避免每个响应块都把全文重新发送给浏览器。
+    全文不足RENDER_BATCH_CHARS时每个响应块都立即渲染：开头的状态提示之后往往是
+    下载和解析PDF的长时间等待，节流会让这些提示在等待期间一直不显示。
+    """
+
+    def __init__(self, placeholder):
+        """
+        Args:
+            placeholder: 用于显示进度的st.empty()占位区域
+        """
+        self.placeholder = placeholder
+        self._parts: List[str] = []
+        self._length = 0
+        self._rendered_length = 0
+        self._last_render_time = time.monotonic()
+
+    def append(self, content: str):
+        """追加一个响应块，并按节流条件刷新显示
+
+        Args:
+            content: 响应块文本
+        """
+        self._parts.append(content)
+        self._length += len(content)
+        now = time.monotonic()
+        if (
+            self._length < RENDER_BATCH_CHARS
+            or self._length - self._rendered_length >= RENDER_BATCH_CHARS
+            or now - self._last_render_time >= RENDER_INTERVAL
+        ):
+            self.placeholder.markdown(self.text())
+            self._rendered_length = self._length
+            self._last_render_time = now
+
+    def text(self) -> str:
+        """返回目前收到的完整文本"""
+        return "".join(self._parts)
 
 
 def process_paper(url: str, prompt_name: str = "yuanbao"):
-    """处理论文并以流式方式yield结果"""
+    """处理论文并以流式方式yield结果
+
+    依次yield若干Chunk响应块，最后yield一个Final表示处理结果
+    """
     try:
         # 验证并格式化URL
         try:
-            url = validate_and_format_arxiv_url(url)
+            arxiv_url = validate_and_format_arxiv_url(url)
         except ValueError as e:
             logger.error(f"URL验证失败: {str(e)}")
-            yield {"type": "final", "success": False, "error": str(e)}
+            yield Final(False, error=str(e))
             return
+        url = arxiv_url.url
 
         logger.info(f"使用提示词模板: {prompt_name}")
         logger.info(f"处理URL: {url}")
 
-        # 创建输出目录及输出文件，文件名中加入用户 session_id 避免不同用户间冲突
-        output_dir = "outputs"
-        os.makedirs(output_dir, exist_ok=True)
+        # 输出文件名中加入用户 session_id 避免不同用户间冲突，输出目录已在脚本入口处创建
         session_id = st.session_state.get("session_id", "default")
         output_file = os.path.join(
-            output_dir, f'analysis_{session_id}_{url.split("/")[-1]}_prompt_{prompt_name}.md'
+            _OUTPUT_DIR, f"analysis_{session_id}_{arxiv_url.pdf_name}_prompt_{prompt_name}.md"
         )
         logger.info(f"输出文件将保存至: {output_file}\n")
 
@@ -86,28 +310,28 @@ def process_paper(url: str, prompt_name: str = "yuanbao"):
         logger.debug("初始化SmartPaper")
         reader = SmartPaper(output_format="markdown")
 
-        # 以写入模式打开文件，覆盖旧内容
+        # 以写入模式打开文件，覆盖旧内容；使用1 MiB缓冲的二进制写入，退出时统一落盘
         logger.debug(f"开始流式处理论文: {url}")
-        with open(output_file, "w", encoding="utf-8") as f:
+        with open(output_file, "wb", buffering=1 << 20) as f:
             chunk_count = 0
             total_length = 0
             for chunk in reader.process_paper_url_stream(url, prompt_name=prompt_name):
                 chunk_count += 1
                 total_length += len(chunk)
-                f.write(chunk)
+                f.write(chunk.encode("utf-8"))
                 if chunk_count % 10 == 0:  # 每10个块记录一次日志，避免日志过多
-                    logger.debug(f"已接收 {chunk_count} 个响应块，总长度: {total_length} 字符")
-                yield {"type": "chunk", "content": chunk}
+                    logger.debug("已接收 {} 个响应块，总长度: {} 字符", chunk_count, total_length)
+                yield Chunk(chunk)
 
         logger.info(f"分析完成，共接收 {chunk_count} 个响应块，总长度: {total_length} 字符")
         logger.info(f"分析结果已保存到: {output_file}")
-        yield {"type": "final", "success": True, "file_path": output_file}
+        yield Final(True, file_path=output_file)
 
     except Exception as e:
         error_msg = f"处理失败: {str(e)}"
         logger.error(error_msg)
-        yield {"type": "chunk", "content": f"❌ **错误**: {error_msg}"}
-        yield {"type": "final", "success": False, "error": error_msg}
+        yield Chunk(f"❌ **错误**: {error_msg}")
+        yield Final(False, error=error_msg)
 
 
 def reanalyze_paper(url: str, prompt_name: str):
@@ -123,16 +347,14 @@ def reanalyze_paper(url: str, prompt_name: str):
 
     # 处理论文
     with st.spinner("正在重新分析论文..."):
-        full_output = ""
+        renderer = StreamRenderer(progress_placeholder)
         for result in process_paper(url, prompt_name):
-            if result["type"] == "chunk":
-                full_output += result["content"]
-                # 实时更新进度显示
-                progress_placeholder.markdown(full_output)
-            elif result["type"] == "final":
-                if result["success"]:
-                    response = full_output
-                    file_path = result["file_path"]
+            if isinstance(result, Chunk):
+                renderer.append(result.content)
+            else:
+                if result.success:
+                    response = renderer.text()
+                    file_path = result.file_path
                     file_name = os.path.basename(file_path)
                     logger.info(f"重新分析成功，结果保存至: {file_path}")
                     new_message = {
@@ -143,8 +365,8 @@ def reanalyze_paper(url: str, prompt_name: str):
                         "url": url,  # 保留URL以支持多次重新分析
                     }
                 else:
-                    logger.error(f"重新分析失败: {result['error']}")
-                    response = result["error"]
+                    logger.error(f"重新分析失败: {result.error}")
+                    response = result.error
                     new_message = {
                         "role": "论文分析助手",
                         "content": response,
@@ -161,108 +383,52 @@ def reanalyze_paper(url: str, prompt_name: str):
     st.rerun()
 
 
+def render_chat_history(prompt_options: Dict[str, str], start: int = 0):
+    """渲染聊天历史
+
+    Args:
+        prompt_options: 提示词名称和描述的字典，供重新分析的选择框使用
+        start: 从第几条消息开始渲染，默认渲染全部消息
+    """
+    prompt_names = list(prompt_options)
+    for i, message in enumerate(st.session_state.messages[start:], start=start):
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+            # 为已处理的论文显示下载按钮
+            if "file_name" in message:
+                st.download_button(
+                    label=f"下载 {message['file_name']}",
+                    data=message["content"],
+                    file_name=message["file_name"],
+                    mime="text/markdown",
+                    key=f"download_{message['file_name']}_{i}",
+                )
+            # 添加重新分析功能
+            if "url" in message:
+                with st.expander("重新分析"):
+                    selected_prompt_reanalyze = st.selectbox(
+                        "选择提示词模板",
+                        options=prompt_names,
+                        format_func=lambda x: f"{x}: {prompt_options[x]}",
+                        key=f"reanalyze_prompt_{i}",
+                    )
+                    if st.button("重新分析", key=f"reanalyze_button_{i}"):
+                        logger.info(
+                            f"用户请求重新分析，使用提示词模板: {selected_prompt_reanalyze}"
+                        )
+                        reanalyze_paper(message["url"], selected_prompt_reanalyze)
+
+
 def main():
     """主函数"""
     logger.info("启动SmartPaperGUI界面")
 
     # 添加自定义CSS样式
-    st.markdown(
-        """
-    <style>
-        /* 整体页面样式 */
-        .main {
-            background-color: #f8f9fa;
-            padding: 20px;
-        }
-
-        /* 标题样式 */
-        h1 {
-            color: #1e3a8a;
-            font-weight: 700;
-            margin-bottom: 30px;
-            text-align: center;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #3b82f6;
-        }
-
-        /* 副标题样式 */
-        h3 {
-            color: #1e40af;
-            font-weight: 600;
-            margin-top: 20px;
-            margin-bottom: 15px;
-            padding-left: 10px;
-            border-left: 4px solid #3b82f6;
-        }
-
-        /* 聊天消息容器 */
-        .stChatMessage {
-            border-radius: 10px;
-            margin-bottom: 15px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }
-
-        /* 按钮样式 */
-        .stButton>button {
-            border-radius: 8px;
-            font-weight: 500;
-            transition: all 0.3s ease;
-        }
-
-        .stButton>button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }
-
-        /* 下载按钮样式 */
-        .stDownloadButton>button {
-            background-color: #4f46e5;
-            color: white;
-            border: none;
-            padding: 5px 15px;
-            border-radius: 6px;
-        }
-
-        /* 侧边栏样式 */
-        .css-1d391kg {
-            background-color: #f1f5f9;
-            padding: 20px 10px;
-        }
-
-        /* 输入框样式 */
-        .stTextInput>div>div>input {
-            border-radius: 8px;
-            border: 1px solid #d1d5db;
-            padding: 10px;
-        }
-
-        /* URL输入框高亮样式 */
-        .url-input {
-            border: 2px solid #3b82f6 !important;
-            background-color: #eff6ff !important;
-            box-shadow: 0 0 10px rgba(59, 130, 246, 0.3) !important;
-        }
-
-        /* 选择框样式 */
-        .stSelectbox>div>div {
-            border-radius: 8px;
-        }
-    </style>
-    """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
     # 设置页面标题
     st.title("SmartPaper")
-    st.markdown(
-        """
-    <div style="color: gray; font-size: 0.8em;">
-        <b>SmartPaper</b>: <a href="https://github.com/sanbuphy/SmartPaper">GitHub</a> -
-        一个迷你助手，帮助您快速阅读论文
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
     # 初始化会话状态
     if "messages" not in st.session_state:
@@ -281,42 +447,26 @@ def main():
 
         # 显示可用的提示词模板
         prompt_options = list_prompts()
-        logger.debug(f"加载提示词模板，共 {len(prompt_options)} 个")
+        logger.debug("加载提示词模板，共 {} 个", len(prompt_options))
         selected_prompt = st.selectbox(
             "选择提示词模板",
             options=list(prompt_options.keys()),
             format_func=lambda x: f"{x}: {prompt_options[x]}",
             help="选择用于分析的提示词模板",
         )
-        logger.debug(f"用户选择提示词模板: {selected_prompt}")
-
-        # 示例URL列表
-        example_urls = [
-            "https://arxiv.org/pdf/2305.12002",
-            "https://arxiv.org/abs/2310.06825",
-            "https://arxiv.org/pdf/2303.08774",
-            "https://arxiv.org/abs/2307.09288",
-            "https://arxiv.org/pdf/2312.11805",
-        ]
+        logger.debug("用户选择提示词模板: {}", selected_prompt)
 
         # 创建示例URL选择器
         st.subheader("选择示例论文")
         selected_example = st.selectbox(
             "选择一个示例论文URL",
-            options=example_urls,
-            format_func=lambda x: x.split("/")[-1] if "/" in x else x,
+            options=EXAMPLE_URLS,
+            format_func=lambda x: x.rpartition("/")[2],
             help="选择一个预设的论文URL作为示例",
         )
 
         # 输入论文URL，使用高亮样式
-        st.markdown(
-            """
-        <div style="margin-top: 20px; margin-bottom: 10px; font-weight: bold; color: #1e40af;">
-            👇 请在下方输入论文URL 👇
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(URL_INPUT_HINT_HTML, unsafe_allow_html=True)
 
         paper_url = st.text_input(
             "论文URL",
@@ -326,24 +476,10 @@ def main():
         )
 
         # 添加JavaScript来高亮URL输入框
-        st.markdown(
-            """
-        <script>
-            // 等待页面加载完成
-            setTimeout(function() {
-                // 获取URL输入框并添加高亮样式
-                const urlInput = document.querySelector('[data-testid="stTextInput"] input');
-                if (urlInput) {
-                    urlInput.classList.add('url-input');
-                }
-            }, 500);
-        </script>
-        """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(URL_HIGHLIGHT_SCRIPT, unsafe_allow_html=True)
 
         if paper_url != selected_example:
-            logger.debug(f"用户输入论文URL: {paper_url}")
+            logger.debug("用户输入论文URL: {}", paper_url)
 
         # 创建两列布局来放置按钮
         col1, col2 = st.columns(2)
@@ -353,20 +489,7 @@ def main():
             clear_button = st.button("清空结果", use_container_width=True)
 
         # 添加一些说明信息
-        st.markdown(
-            """
-        <div style="margin-top: 30px; padding: 15px; background-color: #e0f2fe; border-radius: 8px; border-left: 4px solid #0ea5e9;">
-            <h4 style="margin-top: 0; color: #0369a1;">使用说明</h4>
-            <p style="font-size: 0.9em; color: #0c4a6e;">
-                1. 输入arXiv论文URL<br>
-                2. 选择合适的提示词模板<br>
-                3. 点击"开始分析"按钮<br>
-                4. 等待分析完成后可下载结果
-            </p>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
+        st.markdown(USAGE_INSTRUCTIONS_HTML, unsafe_allow_html=True)
 
     # 清空聊天历史和已处理论文记录
     if clear_button:
@@ -379,33 +502,7 @@ def main():
     chat_container = st.container()
 
     with chat_container:
-        for i, message in enumerate(st.session_state.messages):
-            with st.chat_message(message["role"]):
-                st.markdown(message["content"])
-                # 为已处理的论文显示下载按钮
-                if "file_name" in message:
-                    st.download_button(
-                        label=f"下载 {message['file_name']}",
-                        data=message["content"],
-                        file_name=message["file_name"],
-                        mime="text/markdown",
-                        key=f"download_{message['file_name']}_{i}",
-                    )
-                # 添加重新分析功能
-                if "url" in message:
-                    with st.expander("重新分析"):
-                        prompt_options = list_prompts()
-                        selected_prompt_reanalyze = st.selectbox(
-                            "选择提示词模板",
-                            options=list(prompt_options.keys()),
-                            format_func=lambda x: f"{x}: {prompt_options[x]}",
-                            key=f"reanalyze_prompt_{i}",
-                        )
-                        if st.button("重新分析", key=f"reanalyze_button_{i}"):
-                            logger.info(
-                                f"用户请求重新分析，使用提示词模板: {selected_prompt_reanalyze}"
-                            )
-                            reanalyze_paper(message["url"], selected_prompt_reanalyze)
+        render_chat_history(prompt_options)
 
     # 创建当前分析进展区域
     progress_container = st.container()
@@ -416,25 +513,29 @@ def main():
 
         # 先验证URL格式，如不正确则直接报错提示并更新会话消息
         try:
-            validated_url = validate_and_format_arxiv_url(paper_url)
+            validate_and_format_arxiv_url(paper_url)
         except ValueError as exc:
-            error_stack = traceback.format_exc()
-            logger.error(f"用户输入无效 arXiv URL\n{error_stack}")
+            # 错误栈只交给日志，由loguru在实际输出时才格式化
+            logger.opt(exception=True).error("用户输入无效 arXiv URL")
             st.error(str(exc))
             st.session_state.messages.append(
                 {
                     "role": "论文分析助手",
-                    "content": f"错误: {exc}\n\n详细错误信息:\n{error_stack}",
+                    "content": f"错误: {exc}",
                     "url": paper_url,
                 }
             )
-            st.experimental_rerun()
+            st.rerun()
             return
 
-        if paper_url in st.session_state.processed_papers:
+        processed = st.session_state.processed_papers
+        if paper_url in processed:
             logger.warning(f"论文已分析过: {paper_url}")
             st.warning('该论文已经分析过，如果不满意，可以点击对应分析结果的"重新分析"按钮。')
         else:
+            # 记录新消息的起始位置，分析完成后只渲染新增的消息
+            first_new_index = len(st.session_state.messages)
+
             # 添加用户消息到聊天历史
             st.session_state.messages.append(
                 {"role": "user", "content": f"请分析论文: {paper_url}"}
@@ -447,19 +548,17 @@ def main():
 
             with st.spinner("正在处理论文..."):
                 logger.info(f"开始分析论文: {paper_url}")
-                full_output = ""
+                renderer = StreamRenderer(progress_placeholder)
                 for result in process_paper(paper_url, selected_prompt):
-                    if result["type"] == "chunk":
-                        full_output += result["content"]
-                        # 实时更新进度显示
-                        progress_placeholder.markdown(full_output)
-                    elif result["type"] == "final":
-                        if result["success"]:
+                    if isinstance(result, Chunk):
+                        renderer.append(result.content)
+                    else:
+                        if result.success:
                             logger.info("论文分析成功")
-                            response = full_output
-                            file_path = result["file_path"]
+                            response = renderer.text()
+                            file_path = result.file_path
                             file_name = os.path.basename(file_path)
-                            st.session_state.processed_papers[paper_url] = {
+                            processed[paper_url] = {
                                 "content": response,
                                 "file_path": file_path,
                                 "file_name": file_name,
@@ -473,8 +572,8 @@ def main():
                             }
                             st.session_state.messages.append(message)
                         else:
-                            logger.error(f"论文分析失败: {result['error']}")
-                            response = result["error"]
+                            logger.error(f"论文分析失败: {result.error}")
+                            response = result.error
                             message = {
                                 "role": "论文分析助手",
                                 "content": response,
@@ -486,33 +585,9 @@ def main():
             # 分析完成后清空进度显示
             progress_placeholder.empty()
 
-            # 更新聊天历史显示
+            # 只追加渲染本次新增的消息，已有消息在页面上方已经渲染过
             with chat_container:
-                for i, message in enumerate(st.session_state.messages):
-                    with st.chat_message(message["role"]):
-                        st.markdown(message["content"])
-                        if "file_name" in message:
-                            st.download_button(
-                                label=f"下载 {message['file_name']}",
-                                data=message["content"],
-                                file_name=message["file_name"],
-                                mime="text/markdown",
-                                key=f"download_{message['file_name']}_{i}",
-                            )
-                        if "url" in message:
-                            with st.expander("重新分析"):
-                                prompt_options = list_prompts()
-                                selected_prompt_reanalyze = st.selectbox(
-                                    "选择提示词模板",
-                                    options=list(prompt_options.keys()),
-                                    format_func=lambda x: f"{x}: {prompt_options[x]}",
-                                    key=f"reanalyze_prompt_{i}",
-                                )
-                                if st.button("重新分析", key=f"reanalyze_button_{i}"):
-                                    logger.info(
-                                        f"用户请求重新分析，使用提示词模板: {selected_prompt_reanalyze}"
-                                    )
-                                    reanalyze_paper(message["url"], selected_prompt_reanalyze)
+                render_chat_history(prompt_options, start=first_new_index)
 
 
 if __name__ == "__main__":
@@ -529,7 +604,7 @@ if __name__ == "__main__":
     logger.info("=== SmartPaperGUI启动 ===")
 
     # 创建必要的目录
-    os.makedirs("outputs", exist_ok=True)
+    os.makedirs(_OUTPUT_DIR, exist_ok=True)
 
     # 配置Streamlit页面
     st.set_page_config(
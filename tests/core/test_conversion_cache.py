@@ -0,0 +1,85 @@
+"""
+测试 SmartPaper.convert_url 的 arXiv 转换结果缓存，
+不访问网络：下载和PDF转换均被替换为计数的假实现。
+"""
+
+import os
+from collections import OrderedDict
+
+import pytest
+
+import core.smart_paper_core as smart_paper_core
+from core.smart_paper_core import SmartPaper
+
+
+class _FakeResponse:
+    content = b"%PDF-1.4 fake"
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """替换下载和转换函数，并使用空缓存"""
+    calls = {"download": 0, "convert": 0, "paths": set()}
+
+    def fake_get(url, timeout=None):
+        calls["download"] += 1
+        return _FakeResponse()
+
+    def fake_convert_to_text(path, config=None, converter_name=None):
+        calls["convert"] += 1
+        calls["paths"].add(path)
+        return {"text_content": "正文\n\nReferences\n参考文献", "metadata": {"title": "t"}}
+
+    monkeypatch.setattr(smart_paper_core.requests, "get", fake_get)
+    monkeypatch.setattr(smart_paper_core, "convert_to_text", fake_convert_to_text)
+    monkeypatch.setattr(smart_paper_core, "_conversion_cache", OrderedDict())
+    yield calls
+    for path in calls["paths"]:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+@pytest.fixture
+def reader():
+    """只测试convert_url，不需要初始化LLM等组件"""
+    reader = SmartPaper.__new__(SmartPaper)
+    reader.config = {"document_converter": {"converter_name": "pymupdf"}}
+    return reader
+
+
+def test_second_convert_uses_cache(reader, calls):
+    url = "https://arxiv.org/pdf/9999.00001"
+    first = reader.convert_url(url)
+    second = reader.convert_url(url)
+
+    assert calls["download"] == 1
+    assert calls["convert"] == 1
+    assert first["text_content"] == second["text_content"] == "正文"
+
+
+def test_metadata_changes_do_not_leak_into_cache(reader, calls):
+    url = "https://arxiv.org/pdf/9999.00002"
+    first = reader.convert_url(url, description="第一次")
+    first["metadata"]["title"] = "被修改"
+    second = reader.convert_url(url)
+
+    assert second["metadata"]["title"] == "t"
+    assert "description" not in second["metadata"]
+    assert second["metadata"]["url"] == url
+
+
+def test_cache_evicts_oldest_entries(reader, calls):
+    size = smart_paper_core._CONVERSION_CACHE_SIZE
+    urls = [f"https://arxiv.org/pdf/9999.{i:05d}" for i in range(10, 11 + size)]
+    for url in urls:
+        reader.convert_url(url)
+
+    assert len(smart_paper_core._conversion_cache) == size
+    assert calls["convert"] == size + 1
+
+    # 最早的条目已被淘汰，需要重新下载和转换
+    reader.convert_url(urls[0])
+    assert calls["convert"] == size + 2
@@ -15,7 +15,10 @@ from tools.everything_to_text.image_to_text import (
     extract_text_from_image,
     image_to_base64,
     extract_markdown_content,
+    _detect_mime,
+    _flatten_to_rgb,
 )
+from PIL import Image
 
 
 @pytest.fixture
@@ -114,6 +117,25 @@ def test_extract_markdown_content():
     assert result_without_markdown == "This is plain text"
 
 
+def test_detect_mime(image_path):
+    assert _detect_mime(image_to_base64(image_path)) == "image/png"
+    assert _detect_mime("/9j/4AAQSkZJRgABAQ") == "image/jpeg"
+    assert _detect_mime("R0lGODlhAQABAIAAAP") == "image/gif"
+    assert _detect_mime("UklGRiQAAABXRUJQ") == "image/webp"
+    assert _detect_mime("AAAA") == "image/png"
+
+
+def test_flatten_to_rgb():
+    # 透明背景上的黑色线条，透明区域应变为白色而不是黑色
+    img = Image.new("RGBA", (20, 10), (0, 0, 0, 0))
+    img.putpixel((5, 5), (0, 0, 0, 255))
+    rgb_img = _flatten_to_rgb(img)
+
+    assert rgb_img.mode == "RGB"
+    assert rgb_img.getpixel((0, 0)) == (255, 255, 255)
+    assert rgb_img.getpixel((5, 5)) == (0, 0, 0)
+
+
 @pytest.fixture
 def test_content():
     return "Test content"
@@ -0,0 +1,66 @@
+"""
+测试 pymupdf 转换 PDF 为文本的功能，
+主要判断依据是是否提取出文本、元数据以及是否按要求导出了图片。
+"""
+
+import os
+import shutil
+
+import pytest
+
+from core.document_converter import convert_to_text
+from tools.everything_to_text.pdf_to_md_pymupdf import pymupdf_pdf2md
+
+
+@pytest.fixture
+def pdf_path():
+    current_file_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(
+        current_file_dir, "test_datas/test_mineru_add_image_description_如何阅读一本书.pdf"
+    )
+
+
+def test_pymupdf_pdf2md_text(pdf_path):
+    """测试文本和元数据提取"""
+    result = pymupdf_pdf2md(pdf_path)
+
+    assert isinstance(result["text_content"], str)
+    assert len(result["text_content"]) > 0
+    assert result["metadata"]["page_count"] > 0
+    assert result["images"] == []
+
+
+def test_pymupdf_pdf2md_images(pdf_path):
+    """测试图片导出到指定目录"""
+    current_file_dir = os.path.dirname(os.path.abspath(__file__))
+    image_dir = os.path.join(current_file_dir, "test_datas/test_pymupdf_outputs")
+    if os.path.exists(image_dir):
+        shutil.rmtree(image_dir)
+
+    result = pymupdf_pdf2md(pdf_path, image_dir=image_dir)
+
+    assert result["images"]
+    # 同一图片对象只导出一次，路径不应重复
+    assert len({image["path"] for image in result["images"]}) == len(result["images"])
+    for image in result["images"]:
+        assert os.path.exists(image["path"])
+        assert os.path.dirname(image["path"]) == image_dir
+        assert image["ext"] in ("jpeg", "png")
+
+
+def test_pymupdf_registered(pdf_path):
+    """测试通过转换器注册表调用pymupdf"""
+    result = convert_to_text(pdf_path, converter_name="pymupdf")
+
+    assert "text_content" in result
+    assert "metadata" in result
+
+
+def test_pymupdf_invalid_file():
+    """测试非PDF文件"""
+    with pytest.raises(Exception):
+        pymupdf_pdf2md(__file__)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])